@@ -108,14 +108,12 @@ def list_files(tag='', inst_id='', data_path='', format_str=None,
 
     """
 
+    # pysat performs a check against `inst_id` and `tag` before calling
+    # `list_files`. However, supported_tags is a non-pysat input.
+    format_str = format_str or supported_tags.get(inst_id, {}).get(tag)
     if format_str is None:
-        # pyast performs a check against `inst_id` and `tag` before calling
-        # `list_files`. However, supported_tags is a non-pysat input.
-        try:
-            format_str = supported_tags[inst_id][tag]
-        except KeyError as kerr:
-            raise ValueError(' '.join(('Unknown inst_id or tag:',
-                                       str(kerr))))
+        raise ValueError(' '.join(('Unknown inst_id or tag:',
+                                   repr(inst_id), repr(tag))))
 
     # Get the series of files
     out = pysat.Files.from_os(data_path=data_path, format_str=format_str,
@@ -15,10 +15,21 @@ from pysat.utils import time as putime
 ackn_str = ' '.join(("Test instruments provided through the pysat project.",
                      "https://www.github.com/pysat/pysat"))
 
-# Load up citation information
-with pysat.utils.NetworkLock(os.path.join(pysat.here, 'citation.txt'), 'r') as \
-        locked_file:
-    refs = locked_file.read()
+# Default periods and ranges for the fake data functions, local time and
+# longitude are slightly out of sync to simulate the motion of the Earth.
+# Access these through `define_period` and `define_range` to get copies that
+# may be safely modified.
+_DEF_PERIOD = {'lt': 5820,  # 97 minutes
+               'lon': 6240,  # 104 minutes
+               'angle': 5820}
+_DEF_RANGE = {'lt': (0.0, 24.0),
+              'lon': (0.0, 360.0),
+              'angle': (0.0, 2.0 * np.pi)}
+
+# Load up citation information. The citation file is static package data, so
+# it is read once without a file lock.
+with open(os.path.join(pysat.here, 'citation.txt'), 'r') as fin:
+    refs = fin.read()
 
 
 def init(self, test_init_kwarg=None):
@@ -26,17 +37,16 @@ def init(self, test_init_kwarg=None):
 
     Runs once upon instantiation.
 
-    Shifts time index of files by 5-minutes if `mangle_file_dates`
-    set to True at pysat.Instrument instantiation.
-
-    Creates a file list for a given range if the `file_date_range`
-    keyword is set at instantiation.
-
     Parameters
     ----------
     test_init_kwarg : any
         Testing keyword (default=None)
 
+    Note
+    ----
+    The `mangle_file_dates` and `file_date_range` keywords are handled by
+    `list_files`, so no file list changes are needed here.
+
     """
 
     pysat.logger.info(ackn_str)
@@ -286,10 +296,9 @@ def list_files(tag='', inst_id='', data_path='', format_str=None,
         index = index + dt.timedelta(minutes=5)
 
     # Create the list of fake filenames
-    names = [data_path + date.strftime('%Y-%m-%d') + '.nofile'
-             for date in index]
+    names = data_path + index.strftime('%Y-%m-%d') + '.nofile'
 
-    return pds.Series(names, index=index)
+    return pds.Series(names.values, index=index)
 
 
 def list_remote_files(tag='', inst_id='', data_path='', format_str=None,
@@ -423,7 +432,7 @@ def download(date_array, tag, inst_id, data_path='', user=None,
 
 
 def generate_fake_data(t0, num_array, period=5820, data_range=[0.0, 24.0],
-                       cyclic=True):
+                       cyclic=True, dtype=np.float64):
     """Generate fake data over a given range.
 
     Parameters
@@ -443,6 +452,10 @@ def generate_fake_data(t0, num_array, period=5820, data_range=[0.0, 24.0],
         If True, assume that fake data is a cyclic function (ie, longitude,
         slt) that will reset to data_range[0] once it reaches data_range[1].
         If False, continue to monotonically increase
+    dtype : type
+        Floating point data type of the output for cyclic functions. The time
+        calculations are always performed using double precision.
+        (default=np.float64)
 
     Returns
     -------
@@ -453,8 +466,28 @@ def generate_fake_data(t0, num_array, period=5820, data_range=[0.0, 24.0],
 
     if cyclic:
         uts_root = np.mod(t0, period)
-        data = (np.mod(uts_root + num_array, period)
-                * (np.diff(data_range)[0] / np.float64(period))) + data_range[0]
+        scale = (data_range[1] - data_range[0]) / np.float64(period)
+
+        # Perform the remaining operations in place on a single output buffer,
+        # only reducing the precision once the time within the period is known
+        data = np.array(num_array, dtype=np.float64)
+        data += uts_root
+        np.mod(data, period, out=data)
+        data = data.astype(dtype, copy=False)
+        data *= scale
+        data += data_range[0]
+
+        # Times just below the period may round up to the end of the range
+        # at lower precision, reset these to the start of the range
+        range_end = data.dtype.type(data_range[1])
+        if data_range[1] >= data_range[0]:
+            data[data >= range_end] = data_range[0]
+        else:
+            data[data <= range_end] = data_range[0]
+
+        # Return a scalar for scalar input
+        if data.ndim == 0:
+            data = data[()]
     else:
         data = ((t0 + num_array) / period).astype(int)
 
@@ -499,35 +532,31 @@ def generate_times(fnames, num, freq='1S', start_time=None):
     if start_time is not None and not isinstance(start_time, dt.timedelta):
         raise ValueError('start_time must be a dt.timedelta object')
 
-    uts = []
-    indices = []
-    dates = []
-    for loop, fname in enumerate(fnames):
-        # Grab date from filename
-        parts = os.path.split(fname)[-1].split('-')
-        yr = int(parts[0])
-        month = int(parts[1])
-        day = int(parts[2][0:2])
-        date = dt.datetime(yr, month, day)
-        dates.append(date)
-
-        # Create one day of data at desired frequency
-        end_date = date + dt.timedelta(seconds=86399)
-        if start_time is not None:
-            start_date = date + start_time
-        else:
-            start_date = date
-        index = pds.date_range(start=start_date, end=end_date, freq=freq)
-        index = index[0:num]
-        indices.extend(index)
-        uts.extend(index.hour * 3600 + index.minute * 60 + index.second
-                   + index.microsecond * 1e-6 + 86400. * loop)
-
-    # Combine index times together
-    index = pds.DatetimeIndex(indices)
-
-    # Make UTS an array
-    uts = np.array(uts)
+    # Grab all of the dates from the filenames at once, the fixed-width string
+    # array keeps only the leading YYYY-MM-DD from each file name
+    file_dates = pds.to_datetime(np.array([os.path.basename(fname)
+                                           for fname in fnames], dtype='U10'),
+                                 format='%Y-%m-%d')
+    dates = list(file_dates.to_pydatetime())
+
+    # Create one day of time offsets in integer nanoseconds at the desired
+    # frequency, the same offsets are used for every file. The number of
+    # times is limited so that the offsets do not go beyond the current day.
+    step_ns = pds.tseries.frequencies.to_offset(freq).nanos
+    start_ns = 0 if start_time is None else pds.Timedelta(start_time).value
+    num = min(num, max((86399 * 10**9 - start_ns) // step_ns + 1, 0))
+    offsets = start_ns + step_ns * np.arange(num, dtype=np.int64)
+
+    # Combine the file dates and daily offsets into a single index. Broadcast
+    # to a (file, time) array, so each output is allocated only once, and
+    # flatten in file order.
+    index = pds.DatetimeIndex((file_dates.asi8[:, np.newaxis]
+                               + offsets[np.newaxis, :]).ravel().view(
+                                   'datetime64[ns]'))
+
+    # Calculate UTS, continuing to increase across file boundaries
+    uts = ((offsets / 1.0e9)[np.newaxis, :]
+           + 86400. * np.arange(len(file_dates))[:, np.newaxis]).ravel()
 
     return uts, index, dates
 
@@ -546,9 +575,7 @@ def define_period():
 
     """
 
-    def_period = {'lt': 5820,  # 97 minutes
-                  'lon': 6240,  # 104 minutes
-                  'angle': 5820}
+    def_period = _DEF_PERIOD.copy()
 
     return def_period
 
@@ -563,9 +590,7 @@ def define_range():
 
     """
 
-    def_range = {'lt': [0.0, 24.0],
-                 'lon': [0.0, 360.0],
-                 'angle': [0.0, 2.0 * np.pi]}
+    def_range = {key: list(_DEF_RANGE[key]) for key in _DEF_RANGE.keys()}
 
     return def_range
 
@@ -678,13 +703,11 @@ def non_monotonic_index(index):
 
     """
 
-    new_index = index.tolist()
-
-    # Create a non-monotonic index
-    new_index[6:9], new_index[3:6] = new_index[3:6], new_index[6:9]
-
-    # Convert back to DatetimeIndex
-    new_index = pds.to_datetime(new_index)
+    # Create a non-monotonic index by swapping the 4th-6th and 7th-9th times,
+    # selecting by position to retain the index type and time zone
+    num = len(index)
+    new_index = index[np.r_[0:min(3, num), 6:min(9, num), 3:min(6, num),
+                            9:num]]
 
     return new_index
 
@@ -704,13 +727,10 @@ def non_unique_index(index):
 
     """
 
-    new_index = index.tolist()
-
-    # Create a non-unique index
-    new_index[1:3] = [new_index[1]] * 2
-
-    # Convert back to DatetimeIndex
-    new_index = pds.to_datetime(new_index)
+    # Create a non-unique index by repeating the 2nd time in place of the
+    # 3rd time, selecting by position to retain the index type and time zone
+    num = len(index)
+    new_index = index[np.r_[0:min(2, num), 1:min(2, num), 3:num]]
 
     return new_index
 
@@ -79,9 +79,10 @@ def load(fnames, tag='', inst_id='', non_monotonic_index=False,
     # Support keyword testing
     pysat.logger.info(''.join(('test_load_kwarg = ', str(test_load_kwarg))))
 
-    # Create an artificial satellite data set
-    iperiod = mm_test.define_period()
-    drange = mm_test.define_range()
+    # Create an artificial satellite data set. The default periods and ranges
+    # are not modified here, so they do not need to be copied.
+    iperiod = mm_test._DEF_PERIOD
+    drange = mm_test._DEF_RANGE
 
     # Using 100s frequency for compatibility with seasonal analysis unit tests
     uts, index, dates = mm_test.generate_times(fnames, num_samples, freq='100S',
@@ -98,9 +99,6 @@ def load(fnames, tag='', inst_id='', non_monotonic_index=False,
     if non_unique_index:
         index = mm_test.non_unique_index(index)
 
-    data = xr.Dataset({'uts': ((epoch_name), uts)},
-                      coords={epoch_name: index})
-
     # Need to create simple orbits here. Have start of first orbit
     # at 2009,1, 0 UT. 14.84 orbits per day. Figure out how far in time from
     # the root start a measurement is and use that info to create a signal
@@ -111,91 +109,102 @@ def load(fnames, tag='', inst_id='', non_monotonic_index=False,
     # MLT runs 0-24 each orbit
     mlt = mm_test.generate_fake_data(time_delta.total_seconds(), uts,
                                      period=iperiod['lt'],
-                                     data_range=drange['lt'])
-    data['mlt'] = ((epoch_name), mlt)
+                                     data_range=drange['lt'],
+                                     dtype=np.float32)
 
     # SLT, 20 second offset from `mlt`.
     slt = mm_test.generate_fake_data(time_delta.total_seconds() + 20, uts,
                                      period=iperiod['lt'],
-                                     data_range=drange['lt'])
-    data['slt'] = ((epoch_name), slt)
+                                     data_range=drange['lt'],
+                                     dtype=np.float32)
 
     # Create a fake satellite longitude, resets every 6240 seconds.
     # Satellite moves at 360/5820 deg/s, Earth rotates at 360/86400, takes
     # extra time to go around full longitude.
     longitude = mm_test.generate_fake_data(time_delta.total_seconds(), uts,
                                            period=iperiod['lon'],
-                                           data_range=drange['lon'])
-    data['longitude'] = ((epoch_name), longitude)
+                                           data_range=drange['lon'],
+                                           dtype=np.float32)
 
     # Create fake satellite latitude for testing polar orbits
     angle = mm_test.generate_fake_data(time_delta.total_seconds(), uts,
                                        period=iperiod['angle'],
-                                       data_range=drange['angle'])
-    latitude = max_latitude * np.cos(angle)
-    data['latitude'] = ((epoch_name), latitude)
+                                       data_range=drange['angle'],
+                                       dtype=np.float32)
+    latitude = (max_latitude * np.cos(angle)).astype(np.float32, copy=False)
 
     # Create constant altitude at 400 km for a satellite that has yet
     # to experience orbital decay
+    num = len(index)
     alt0 = 400.0
-    altitude = alt0 * np.ones(data['latitude'].shape)
-    data['altitude'] = ((epoch_name), altitude)
+    altitude = np.full(num, alt0, dtype=np.float32)
 
     # Create some fake data to support testing of averaging routines
-    mlt_int = data['mlt'].astype(int).data
-    long_int = (data['longitude'] / 15.).astype(int).data
-    data['dummy1'] = ((epoch_name), mlt_int)
-    data['dummy2'] = ((epoch_name), long_int)
-    data['dummy3'] = ((epoch_name), mlt_int + long_int * 1000.)
-    data['dummy4'] = ((epoch_name), uts)
-    data['string_dummy'] = ((epoch_name),
-                            ['test'] * len(data.indexes[epoch_name]))
-    data['unicode_dummy'] = ((epoch_name),
-                             [u'test'] * len(data.indexes[epoch_name]))
-    data['int8_dummy'] = ((epoch_name),
-                          np.ones(len(data.indexes[epoch_name]), dtype=np.int8))
-    data['int16_dummy'] = ((epoch_name),
-                           np.ones(len(data.indexes[epoch_name]),
-                                   dtype=np.int16))
-    data['int32_dummy'] = ((epoch_name),
-                           np.ones(len(data.indexes[epoch_name]),
-                                   dtype=np.int32))
-    data['int64_dummy'] = ((epoch_name),
-                           np.ones(len(data.indexes[epoch_name]),
-                                   dtype=np.int64))
-
-    # Add dummy coords
-    data.coords['x'] = (('x'), np.arange(17))
-    data.coords['y'] = (('y'), np.arange(17))
-    data.coords['z'] = (('z'), np.arange(15))
-
-    # Create altitude 'profile' at each location to simulate remote data
-    num = len(data['uts'])
-    data['profiles'] = (
-        (epoch_name, 'profile_height'),
-        data['dummy3'].values[:, np.newaxis] * np.ones((num, 15)))
-    data.coords['profile_height'] = ('profile_height', np.arange(15))
-
-    # Profiles that could have different altitude values
-    data['variable_profiles'] = (
-        (epoch_name, 'z'), data['dummy3'].values[:, np.newaxis]
-        * np.ones((num, 15)))
-    data.coords['variable_profile_height'] = (
-        (epoch_name, 'z'), np.arange(15)[np.newaxis, :] * np.ones((num, 15)))
-
-    # Create fake image type data, projected to lat / lon at some location
-    # from satellite.
-    data['images'] = ((epoch_name, 'x', 'y'),
-                      data['dummy3'].values[
-                          :, np.newaxis, np.newaxis] * np.ones((num, 17, 17)))
-    data.coords['image_lat'] = \
-        ((epoch_name, 'x', 'y'),
-         np.arange(17)[np.newaxis,
-                       np.newaxis,
-                       :] * np.ones((num, 17, 17)))
-    data.coords['image_lon'] = ((epoch_name, 'x', 'y'),
-                                np.arange(17)[np.newaxis, np.newaxis,
-                                              :] * np.ones((num, 17, 17)))
+    mlt_int = mlt.astype(int)
+    long_int = (longitude / 15.).astype(int)
+    dummy3 = mlt_int + long_int * 1000.
+
+    # Create each coordinate range once and share it between the coordinates
+    # with the same size
+    range17 = np.arange(17)
+    range15 = np.arange(15)
+    range17f = range17.astype(np.float32)
+    range15f = range15.astype(np.float32)
+
+    # Collect all of the data and coordinates in the desired variable order,
+    # so that the Dataset is only built and validated once. The 1D data are
+    # broadcast to the desired shape and copied once, so that the data are
+    # writable without creating and multiplying by an array of ones.
+    variables = {
+        'uts': ((epoch_name), uts),
+        epoch_name: index,
+        'mlt': ((epoch_name), mlt),
+        'slt': ((epoch_name), slt),
+        'longitude': ((epoch_name), longitude),
+        'latitude': ((epoch_name), latitude),
+        'altitude': ((epoch_name), altitude),
+        'dummy1': ((epoch_name), mlt_int),
+        'dummy2': ((epoch_name), long_int),
+        'dummy3': ((epoch_name), dummy3),
+        'dummy4': ((epoch_name), uts),
+        'string_dummy': ((epoch_name), ['test'] * num),
+        'unicode_dummy': ((epoch_name), [u'test'] * num),
+        'int8_dummy': ((epoch_name), np.ones(num, dtype=np.int8)),
+        'int16_dummy': ((epoch_name), np.ones(num, dtype=np.int16)),
+        'int32_dummy': ((epoch_name), np.ones(num, dtype=np.int32)),
+        'int64_dummy': ((epoch_name), np.ones(num, dtype=np.int64)),
+        # Add dummy coords
+        'x': (('x'), range17),
+        'y': (('y'), range17),
+        'z': (('z'), range15),
+        # Create altitude 'profile' at each location to simulate remote data
+        'profiles': ((epoch_name, 'profile_height'),
+                     np.broadcast_to(dummy3[:, np.newaxis],
+                                     (num, 15)).copy()),
+        'profile_height': ('profile_height', range15),
+        # Profiles that could have different altitude values
+        'variable_profiles': ((epoch_name, 'z'),
+                              np.broadcast_to(dummy3[:, np.newaxis],
+                                              (num, 15)).copy()),
+        'variable_profile_height': (
+            (epoch_name, 'z'),
+            np.broadcast_to(range15f, (num, 15)).copy()),
+        # Create fake image type data, projected to lat / lon at some location
+        # from satellite. Single precision is sufficient for the images.
+        'images': ((epoch_name, 'x', 'y'),
+                   np.broadcast_to(dummy3[:, np.newaxis, np.newaxis],
+                                   (num, 17, 17)).astype(np.float32)),
+        'image_lat': (
+            (epoch_name, 'x', 'y'),
+            np.broadcast_to(range17f, (num, 17, 17)).copy()),
+        'image_lon': (
+            (epoch_name, 'x', 'y'),
+            np.broadcast_to(range17f, (num, 17, 17)).copy())}
+
+    # Dimension variables become coordinates automatically, the remaining
+    # coordinates are assigned without changing the variable order
+    data = xr.Dataset(variables).set_coords(['variable_profile_height',
+                                             'image_lat', 'image_lon'])
 
     meta = mm_test.initialize_test_meta(epoch_name, data.keys())
     return data, meta
@@ -204,4 +213,4 @@ def load(fnames, tag='', inst_id='', non_monotonic_index=False,
 list_files = functools.partial(mm_test.list_files, test_dates=_test_dates)
 list_remote_files = functools.partial(mm_test.list_remote_files,
                                       test_dates=_test_dates)
-download = functools.partial(mm_test.download)
+download = mm_test.download
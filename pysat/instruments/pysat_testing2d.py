@@ -228,4 +228,4 @@ def load(fnames, tag='', inst_id='', malformed_index=False,
 list_files = functools.partial(mm_test.list_files, test_dates=_test_dates)
 list_remote_files = functools.partial(mm_test.list_remote_files,
                                       test_dates=_test_dates)
-download = functools.partial(mm_test.download)
+download = mm_test.download
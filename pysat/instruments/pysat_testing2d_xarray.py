@@ -10,7 +10,6 @@
 """
 
 import datetime as dt
-import functools
 import numpy as np
 import warnings
 
@@ -59,8 +58,8 @@ preprocess = pysat_ndtesting.preprocess
 
 load = pysat_ndtesting.load
 
-list_files = functools.partial(pysat_ndtesting.list_files,
-                               test_dates=_test_dates)
-list_remote_files = functools.partial(pysat_ndtesting.list_remote_files,
-                                      test_dates=_test_dates)
-download = functools.partial(pysat_ndtesting.download)
+# The test dates are shared with pysat_ndtesting, so the file and download
+# functions may be used directly
+list_files = pysat_ndtesting.list_files
+list_remote_files = pysat_ndtesting.list_remote_files
+download = pysat_ndtesting.download
@@ -217,4 +217,4 @@ def load(fnames, tag='', inst_id='', start_time=None, num_samples=96,
 list_files = functools.partial(mm_test.list_files, test_dates=_test_dates)
 list_remote_files = functools.partial(mm_test.list_remote_files,
                                       test_dates=_test_dates)
-download = functools.partial(mm_test.download)
+download = mm_test.download
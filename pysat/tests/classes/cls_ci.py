@@ -35,7 +35,8 @@ class CICleanSetup(object):
         if not self.ci_env:
             pytest.skip("Skipping local tests to avoid breaking user setup")
         else:
-            # Move settings directory to simulate first load after install
+            # Move settings directory to simulate first load after install.
+            # Both directories are in the home directory, so a rename is used.
             self.root = os.path.join(os.path.expanduser("~"), '.pysat')
             self.new_root = os.path.join(os.path.expanduser("~"),
                                          '.saved_pysat')
@@ -44,7 +45,7 @@ class CICleanSetup(object):
                 shutil.rmtree(self.new_root)
             except FileNotFoundError:
                 pass
-            shutil.move(self.root, self.new_root)
+            os.rename(self.root, self.new_root)
         return
 
     def teardown_method(self):
@@ -52,7 +53,7 @@ class CICleanSetup(object):
         if self.ci_env:
             # Move settings back
             shutil.rmtree(self.root)
-            shutil.move(self.new_root, self.root)
+            os.rename(self.new_root, self.root)
 
             # Restore pysat and directory paths
             reload(pysat)
@@ -50,7 +50,7 @@ class InstIntegrationTests(object):
         # Change pysat directory to temporary directory
         tempdir = tempfile.TemporaryDirectory()
         saved_dir = pysat.params['data_dirs']
-        pysat.params['data_dirs'] = tempdir.name
+        pysat.params._set_data_dirs(tempdir.name, store=False)
 
         # Make another new instrument now that `data_dirs` changed. Normally,
         # pysat will use whatever directory was stored with the list of
@@ -60,7 +60,7 @@ class InstIntegrationTests(object):
             self.testInst = eval(inst_str)
 
         # Restore pysat directory before any further assertions
-        pysat.params['data_dirs'] = saved_dir
+        pysat.params._set_data_dirs(saved_dir, store=False)
 
         # Ensure debug message printed for observed change in data directories
         dstr = ' '.join(['`data_path` found',
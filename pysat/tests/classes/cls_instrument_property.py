@@ -494,18 +494,21 @@ class InstPropertyTests(object):
         return
 
     @pytest.mark.parametrize('del_routine', ['list_files', 'load'])
-    def test_custom_instrument_load_incomplete(self, del_routine):
+    def test_custom_instrument_load_incomplete(self, del_routine,
+                                               monkeypatch):
         """Test if exception is thrown if supplied routines are incomplete.
 
         Parameters
         ----------
         del_routine : str
             Name of required routine to delete from module.
+        monkeypatch : pytest.MonkeyPatch
+            Restores the deleted routine after the test.
 
         """
 
         import pysat.instruments.pysat_testing as test
-        delattr(test, del_routine)
+        monkeypatch.delattr(test, del_routine)
 
         estr = 'A `{:}` function is required'.format(del_routine)
         testing.eval_bad_input(pysat.Instrument, AttributeError, estr,
@@ -0,0 +1,68 @@
+#!/usr/bin/env python
+# Full license can be found in License.md
+# Full author list can be found in .zenodo.json file
+# DOI:10.5281/zenodo.1199703
+# ----------------------------------------------------------------------------
+"""Pytest configuration for running the pysat tests in parallel."""
+
+from importlib import reload
+import os
+import shutil
+import tempfile
+
+import pysat
+
+# Temporary home directory used by a pytest-xdist worker
+worker_home = None
+
+
+def pytest_configure(config):
+    """Give each pytest-xdist worker a separate pysat directory.
+
+    Parameters
+    ----------
+    config : pytest.Config
+        Pytest configuration object
+
+    Note
+    ----
+    Stored file lists in the pysat directory are shared by every process
+    using it, so parallel workers would otherwise overwrite each other's
+    lists.  Each worker uses a temporary home directory, starting from a
+    copy of the current pysat settings.
+
+    """
+
+    global worker_home
+
+    worker = os.environ.get('PYTEST_XDIST_WORKER')
+    if worker is not None:
+        worker_home = tempfile.mkdtemp(prefix='_'.join(('pysat', worker, '')))
+        worker_dir = os.path.join(worker_home, '.pysat')
+        os.makedirs(os.path.join(worker_dir, 'instruments', 'archive'))
+        shutil.copy(os.path.join(pysat.pysat_dir, 'pysat_settings.json'),
+                    worker_dir)
+
+        # Set the home directory for all platforms, and reload pysat so that
+        # the new pysat directory and settings are used
+        os.environ['HOME'] = worker_home
+        os.environ['USERPROFILE'] = worker_home
+        reload(pysat)
+
+    return
+
+
+def pytest_unconfigure(config):
+    """Remove the temporary pysat directory of a pytest-xdist worker.
+
+    Parameters
+    ----------
+    config : pytest.Config
+        Pytest configuration object
+
+    """
+
+    if worker_home is not None:
+        shutil.rmtree(worker_home, ignore_errors=True)
+
+    return
@@ -144,7 +144,7 @@ class TestBasics(object):
 
         # Create temporary directory
         self.tempdir = tempfile.TemporaryDirectory()
-        pysat.params['data_dirs'] = [self.tempdir.name]
+        pysat.params._set_data_dirs([self.tempdir.name], store=False)
 
         self.testInst = pysat.Instrument(
             inst_module=pysat.instruments.pysat_testing, clean_level='clean',
@@ -157,7 +157,7 @@ class TestBasics(object):
 
     def teardown_method(self):
         """Clean up the unit test environment after each method."""
-        pysat.params['data_dirs'] = self.data_paths
+        pysat.params._set_data_dirs(self.data_paths, store=False)
         self.tempdir.cleanup()
         del self.testInst, self.out, self.tempdir, self.start, self.stop
         return
@@ -709,7 +709,7 @@ class TestInstWithFiles(object):
 
         # Create temporary directory
         self.tempdir = tempfile.TemporaryDirectory()
-        pysat.params['data_dirs'] = [self.tempdir.name]
+        pysat.params._set_data_dirs([self.tempdir.name], store=False)
 
         # Create the testing directory
         create_dir(temporary_file_list=self.temporary_file_list)
@@ -760,7 +760,7 @@ class TestInstWithFiles(object):
                          clean_level='clean',
                          update_files=True,
                          temporary_file_list=self.temporary_file_list)
-        pysat.params['data_dirs'] = self.data_paths
+        pysat.params._set_data_dirs(self.data_paths, store=False)
         self.tempdir.cleanup()
         del self.tempdir, self.start, self.stop, self.start2, self.stop2
         return
@@ -900,14 +900,13 @@ class TestInstWithFiles(object):
 
         # Remove files, same number as will be added
         to_be_removed = len(dates)
-        for the_file in os.listdir(self.testInst.files.data_path):
-            if (the_file[0:13] == 'pysat_testing') \
-                    and the_file[-19:] == '.pysat_testing_file':
-                file_path = os.path.join(self.testInst.files.data_path,
-                                         the_file)
-                if os.path.isfile(file_path) & (to_be_removed > 0):
-                    to_be_removed -= 1
-                    os.unlink(file_path)
+        with os.scandir(self.testInst.files.data_path) as dir_entries:
+            for entry in dir_entries:
+                if (entry.name[0:13] == 'pysat_testing') \
+                        and entry.name[-19:] == '.pysat_testing_file':
+                    if entry.is_file() & (to_be_removed > 0):
+                        to_be_removed -= 1
+                        os.unlink(entry.path)
 
         # Add new files
         create_files(self.testInst, self.start2, self.stop2, freq='100min',
@@ -942,7 +941,7 @@ class TestInstWithFilesNonStandard(object):
 
         # Create temporary directory
         self.tempdir = tempfile.TemporaryDirectory()
-        pysat.params['data_dirs'] = [self.tempdir.name]
+        pysat.params._set_data_dirs([self.tempdir.name], store=False)
 
         self.start = dt.datetime(2008, 1, 11)
         self.stop = dt.datetime(2008, 1, 15)
@@ -969,7 +968,7 @@ class TestInstWithFilesNonStandard(object):
 
         # Make sure everything about instrument state is restored. In
         # particular, restore the original file list (no files)
-        pysat.params['data_dirs'] = self.data_paths
+        pysat.params._set_data_dirs(self.data_paths, store=False)
         pysat.Instrument(inst_module=pysat.instruments.pysat_testing,
                          clean_level='clean',
                          update_files=True,
@@ -1219,7 +1218,8 @@ def create_instrument(j):
                                 update_files=True,
                                 temporary_file_list=False)
 
-    print('initial files created in {}:'.format(testInst.files.data_path))
+    pysat.logger.debug('initial files created in {}:'.format(
+        testInst.files.data_path))
 
     return 'instrument {}'.format(j)
 
@@ -1244,7 +1244,7 @@ class TestFilesRaceCondition(object):
 
         # Create temporary directory
         self.tempdir = tempfile.TemporaryDirectory()
-        pysat.params['data_dirs'] = [self.tempdir.name]
+        pysat.params._set_data_dirs([self.tempdir.name], store=False)
 
         # Create testing directory
         create_dir(temporary_file_list=self.temporary_file_list)
@@ -1278,8 +1278,8 @@ class TestFilesRaceCondition(object):
             update_files=True,
             temporary_file_list=self.temporary_file_list)
 
-        print(' '.join(('initial files created in ',
-                        self.testInst.files.data_path)))
+        pysat.logger.debug(' '.join(('initial files created in ',
+                                     self.testInst.files.data_path)))
 
     def teardown_method(self):
         """Clean up the unit test environment after each method."""
@@ -1293,7 +1293,7 @@ class TestFilesRaceCondition(object):
                          clean_level='clean',
                          update_files=True,
                          temporary_file_list=self.temporary_file_list)
-        pysat.params['data_dirs'] = self.data_paths
+        pysat.params._set_data_dirs(self.data_paths, store=False)
 
     # TODO(#871): This needs to be replaced or expanded based on the tests that
     # portalocker uses
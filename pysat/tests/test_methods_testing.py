@@ -1,6 +1,7 @@
 """Tests the `pysat.instruments.methods.testing` methods."""
 
 import datetime as dt
+import numpy as np
 from os import path
 import pandas as pds
 import pytest
@@ -83,3 +84,124 @@ class TestMethodsTesting(object):
         delta_time = [dt.timedelta(seconds=sec) for sec in uts]
         assert (index.to_pydatetime() - delta_time == dates).all
         return
+
+    @pytest.mark.parametrize("num,kwargs",
+                             [(10, {}),
+                              (10, {'start_time': dt.timedelta(hours=1),
+                                    'freq': '10s'}),
+                              (87000, {}),
+                              (10, {'freq': '10mS'})])
+    @pytest.mark.parametrize("nfiles", [2, 3])
+    def test_generate_times_multiple_files(self, num, kwargs, nfiles):
+        """Test generate_times orders output by file, then by time.
+
+        Parameters
+        ----------
+        num : int
+            Number of times to generate
+        kwargs : dict
+            Passed to `mm_test.generate_times`
+        nfiles : int
+            Number of consecutive daily files
+
+        """
+
+        file_dates = pds.date_range(dt.datetime(2009, 1, 1), periods=nfiles,
+                                    freq='1D')
+        fnames = [path.join('test', date.strftime('%Y-%m-%d.nofile'))
+                  for date in file_dates]
+        uts, index, dates = mm_test.generate_times(fnames, num, **kwargs)
+        day_uts, day_index, _ = mm_test.generate_times(fnames[:1], num,
+                                                       **kwargs)
+
+        assert dates == list(file_dates.to_pydatetime())
+        assert len(uts) == len(index)
+        assert len(uts) == nfiles * len(day_uts)
+
+        # Universal time keeps increasing across the file boundaries
+        assert np.all(np.diff(uts) > 0)
+        for i, date in enumerate(dates):
+            file_slice = slice(i * len(day_uts), (i + 1) * len(day_uts))
+            assert np.array_equal(uts[file_slice], day_uts + i * 86400.0)
+
+            # The index is ordered by file, then by time
+            assert index[file_slice].equals(day_index + (date - dates[0]))
+
+        assert index.is_monotonic_increasing
+        return
+
+    @pytest.mark.parametrize("num", [3, 3.0, np.float64(3.0)])
+    def test_generate_fake_data_cyclic_scalar(self, num):
+        """Test cyclic fake data supports scalar input.
+
+        Parameters
+        ----------
+        num : int or float
+            Time step from t0
+
+        """
+
+        data = mm_test.generate_fake_data(5, num)
+
+        assert np.ndim(data) == 0
+        assert np.isclose(data, 8.0 * 24.0 / 5820.0)
+        assert data == mm_test.generate_fake_data(5, np.array([num]))[0]
+        return
+
+    @pytest.mark.parametrize("data_range", [[0.0, 24.0], [24.0, 0.0]])
+    @pytest.mark.parametrize("dtype", [np.float32, np.float64])
+    def test_generate_fake_data_cyclic_range_end(self, data_range, dtype):
+        """Test cyclic fake data just below the period stays within range.
+
+        Parameters
+        ----------
+        data_range : list
+            Range of data values cycled over one period
+        dtype : type
+            Floating point data type of the output
+
+        """
+
+        num_array = np.array([0.0, 5819.9999, 5820.0])
+        data = mm_test.generate_fake_data(0, num_array, data_range=data_range,
+                                          dtype=dtype)
+
+        assert data.dtype == dtype
+        assert np.all(data != data_range[1])
+        assert data[0] == data_range[0]
+        assert data[2] == data_range[0]
+        return
+
+    @pytest.mark.parametrize("func, attr", [
+        ("non_monotonic_index", "is_monotonic_increasing"),
+        ("non_unique_index", "is_unique")])
+    @pytest.mark.parametrize("tz", [None, "UTC"])
+    def test_malformed_index_type(self, func, attr, tz):
+        """Test the malformed index functions retain the index type.
+
+        Parameters
+        ----------
+        func : str
+            Name of the index function to test
+        attr : str
+            Index attribute that should be False for the output
+        tz : str or NoneType
+            Time zone of the input index
+
+        """
+
+        index = pds.date_range(dt.datetime(2009, 1, 1), periods=12,
+                               freq='100S', tz=tz)
+        new_index = getattr(mm_test, func)(index)
+
+        assert isinstance(new_index, pds.DatetimeIndex)
+        assert new_index.tz == index.tz
+        assert len(new_index) == len(index)
+        assert not getattr(new_index, attr)
+        return
+
+    def test_refs(self):
+        """Test the module citation information matches the Instrument."""
+
+        assert mm_test.refs == self.test_inst.references
+        return
@@ -23,8 +23,8 @@ class TestBasics(object):
 
     def setup_method(self):
         """Set up the unit test environment for each method."""
-        # Store current pysat directory
-        self.stored_params = copy.deepcopy(pysat.params)
+        # Store current pysat settings, only the data dict needs to be restored
+        self.stored_data = copy.deepcopy(pysat.params.data)
 
         # Set up default values
         pysat.params.restore_defaults()
@@ -35,9 +35,8 @@ class TestBasics(object):
 
     def teardown_method(self):
         """Clean up the unit test environment after each method."""
-        pysat.params = copy.deepcopy(self.stored_params)
+        pysat.params.data = self.stored_data
         pysat.params.store()
-        reload(pysat)
         os.chdir(self.wd)
         self.tempdir.cleanup()
 
@@ -61,9 +60,9 @@ class TestBasics(object):
         pysat.params['data_dirs'] = paths
         assert pysat.params['data_dirs'] == check
 
-        # Check if next load of pysat remembers the change
-        reload(pysat)
-        assert pysat.params['data_dirs'] == check
+        # Check if the next load of the stored settings remembers the change
+        new_params = Parameters()
+        assert new_params['data_dirs'] == check
         return
 
     @pytest.mark.parametrize("path", ['no_path', 'not_a_directory'])
@@ -207,16 +206,16 @@ class TestCIonly(CICleanSetup):
         # Ensure pysat is running in 'first-time' mode
         assert captured.out.find("Hi there!") >= 0
 
-        # Remove pysat settings file
-        shutil.move(os.path.join(self.root, 'pysat_settings.json'),
-                    os.path.join(self.root, 'pysat_settings_moved.json'))
+        # Remove pysat settings file, renaming it within the same directory
+        os.rename(os.path.join(self.root, 'pysat_settings.json'),
+                  os.path.join(self.root, 'pysat_settings_moved.json'))
 
         # Ensure we can't create a parameters file without valid .json
         testing.eval_bad_input(Parameters, OSError,
                                'pysat is unable to locate a user settings')
 
-        shutil.move(os.path.join(self.root, 'pysat_settings_moved.json'),
-                    os.path.join(self.root, 'pysat_settings.json'))
+        os.rename(os.path.join(self.root, 'pysat_settings_moved.json'),
+                  os.path.join(self.root, 'pysat_settings.json'))
         return
 
     def test_settings_file_cwd(self, capsys):
@@ -161,7 +161,7 @@ class TestCIonly(object):
         # Move settings directory to simulate first load after install
         root = os.path.join(os.path.expanduser("~"), '.pysat')
         new_root = os.path.join(os.path.expanduser("~"), '.saved_pysat')
-        shutil.move(root, new_root)
+        os.rename(root, new_root)
 
         reload(pysat)
 
@@ -175,7 +175,7 @@ class TestCIonly(object):
 
         # Move settings back
         shutil.rmtree(root)
-        shutil.move(new_root, root)
+        os.rename(new_root, root)
 
         # Make sure pysat reloads settings
         reload(pysat)
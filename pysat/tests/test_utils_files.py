@@ -172,7 +172,7 @@ class TestFileDirectoryTranslations(CICleanSetup):
                                        self.insts_kwargs):
             ostr = ' '.join(('Downloading data for', inst.platform,
                              inst.name, inst.tag, inst.inst_id))
-            print(ostr)
+            pysat.logger.debug(ostr)
 
             # Support non-daily download frequencies
             dates = pds.date_range(dates[0], dates[1], **kwargs)
@@ -322,7 +322,7 @@ class TestFileUtils(CICleanSetup):
 
         # Create temporary directory
         self.tempdir = tempfile.TemporaryDirectory()
-        pysat.params['data_dirs'] = [self.tempdir.name]
+        pysat.params._set_data_dirs([self.tempdir.name], store=False)
 
         self.testInst = pysat.Instrument(
             inst_module=pysat.instruments.pysat_testing, clean_level='clean',
@@ -334,7 +334,7 @@ class TestFileUtils(CICleanSetup):
 
     def teardown_method(self):
         """Clean up the unit test environment after each method."""
-        pysat.params['data_dirs'] = self.data_paths
+        pysat.params._set_data_dirs(self.data_paths, store=False)
         self.tempdir.cleanup()
         del self.testInst, self.out, self.tempdir, self.start, self.stop
         return
@@ -58,7 +58,7 @@ class TestLoadNetCDF(object):
         # Create temporary directory
         self.tempdir = tempfile.TemporaryDirectory()
         self.saved_path = pysat.params['data_dirs']
-        pysat.params['data_dirs'] = self.tempdir.name
+        pysat.params._set_data_dirs(self.tempdir.name, store=False)
 
         self.testInst = pysat.Instrument(platform='pysat', name='testing',
                                          num_samples=100, update_files=True,
@@ -73,7 +73,7 @@ class TestLoadNetCDF(object):
     def teardown_method(self):
         """Clean up the test environment."""
 
-        pysat.params['data_dirs'] = self.saved_path
+        pysat.params._set_data_dirs(self.saved_path, store=False)
 
         # Clear the attributes with data in them
         del self.loaded_inst, self.testInst, self.stime, self.epoch_name
@@ -693,7 +693,7 @@ class TestLoadNetCDFXArray(TestLoadNetCDF):
             self.tempdir = tempfile.TemporaryDirectory()
 
         self.saved_path = pysat.params['data_dirs']
-        pysat.params['data_dirs'] = self.tempdir.name
+        pysat.params._set_data_dirs(self.tempdir.name, store=False)
 
         self.testInst = pysat.Instrument(platform='pysat',
                                          name='ndtesting',
@@ -710,7 +710,7 @@ class TestLoadNetCDFXArray(TestLoadNetCDF):
     def teardown_method(self):
         """Clean up the test environment."""
 
-        pysat.params['data_dirs'] = self.saved_path
+        pysat.params._set_data_dirs(self.saved_path, store=False)
 
         # Clear the attributes with data in them
         del self.loaded_inst, self.testInst, self.stime, self.epoch_name
@@ -798,7 +798,7 @@ class TestLoadNetCDF2DPandas(TestLoadNetCDF):
         # Create temporary directory
         self.tempdir = tempfile.TemporaryDirectory()
         self.saved_path = pysat.params['data_dirs']
-        pysat.params['data_dirs'] = self.tempdir.name
+        pysat.params._set_data_dirs(self.tempdir.name, store=False)
 
         self.testInst = pysat.Instrument(platform='pysat', name='testing2d',
                                          update_files=True, num_samples=100,
@@ -813,7 +813,7 @@ class TestLoadNetCDF2DPandas(TestLoadNetCDF):
     def teardown_method(self):
         """Clean up the test environment."""
 
-        pysat.params['data_dirs'] = self.saved_path
+        pysat.params._set_data_dirs(self.saved_path, store=False)
 
         # Clear the attributes with data in them
         del self.loaded_inst, self.testInst, self.stime, self.epoch_name
@@ -1901,7 +1901,7 @@ class TestIODeprecation(object):
         # Create temporary directory
         self.tempdir = tempfile.TemporaryDirectory()
         self.saved_path = pysat.params['data_dirs']
-        pysat.params['data_dirs'] = self.tempdir.name
+        pysat.params._set_data_dirs(self.tempdir.name, store=False)
 
         self.outfile = os.path.join(self.tempdir.name, 'pysat_test_ncdf.nc')
         self.in_kwargs = {'labels': {
@@ -1915,7 +1915,7 @@ class TestIODeprecation(object):
     def teardown_method(self):
         """Clean up the test environment."""
 
-        pysat.params['data_dirs'] = self.saved_path
+        pysat.params._set_data_dirs(self.saved_path, store=False)
 
         # Remove the temporary directory
         self.tempdir.cleanup()
@@ -5,7 +5,6 @@
 # ----------------------------------------------------------------------------
 """Coordinate transformation functions for pysat."""
 
-import datetime as dt
 import numpy as np
 import pandas as pds
 import xarray as xr
@@ -119,16 +118,10 @@ def calc_solar_local_time(inst, lon_name=None, slt_name='slt',
         # Use user supplied reference date.
         ref_date = pds.Timestamp(ref_date)
 
-    # Convert from numpy epoch nanoseconds to UT seconds of day
-    ut_hr = list()
-    for nptime in inst.index.values.astype(np.int64):
-        # Numpy times come out in nanoseconds and timestamp converts
-        # from seconds
-        dtime = dt.datetime.utcfromtimestamp(nptime * 1.0e-9)
-        ut_hr.append((dtime.hour * 3600.0 + dtime.minute * 60.0
-                      + dtime.second + dtime.microsecond * 1.0e-6) / 3600.0)
-
-    ut_hr = np.array(ut_hr)
+    # Convert from numpy epoch nanoseconds to UT hours of day, using a single
+    # integer modulus against the number of nanoseconds in a day
+    day_ns = 86400 * 10**9
+    ut_hr = np.mod(inst.index.values.astype(np.int64), day_ns) / 3.6e12
 
     # Account for difference in days for calculations without modulus
     if not apply_modulus: